@@ -550,8 +550,7 @@ def export_transform_position(output_directory: str, file_name: str, method: str
 
     # Get the hierarchy data
     transform_hierarchy = lib_transform.TransformHierarchy()
-    for transform in transforms:
-        transform_hierarchy.register_node(transform)
+    transform_hierarchy.register_nodes(transforms)
 
     export_data = {
         "method": method,
@@ -12,6 +12,14 @@ from ..lib import lib_attribute
 
 logger = getLogger(__name__)
 
+_RAD2DEG = 180.0 / math.pi
+
+_MIRROR_MATRICES = {
+    "x": om.MMatrix([[-1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]]),
+    "y": om.MMatrix([[1, 0, 0, 0], [0, -1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]]),
+    "z": om.MMatrix([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, -1, 0], [0, 0, 0, 1]]),
+}
+
 
 def combine_rotation(node: str, target_attribute: str = "rotate") -> None:
     """Combines the rotation of the node.
@@ -129,48 +137,77 @@ def mirror_dag_node(source_node: str, target_node: str, axis: str = "x", mirror_
     if not source_node or not target_node:
         raise ValueError("Node is not specified.")
 
+    mirror_dag_nodes([source_node], [target_node], axis=axis, mirror_position=mirror_position, mirror_rotation=mirror_rotation)
+
+
+def mirror_dag_nodes(
+    source_nodes: list[str], target_nodes: list[str], axis: str = "x", mirror_position: bool = True, mirror_rotation: bool = True
+) -> None:
+    """Mirror the dag nodes.
+
+    Notes:
+        - The world matrices of all source nodes are read before any target node is changed.
+
+    Args:
+        source_nodes (list[str]): The source nodes.
+        target_nodes (list[str]): The target nodes. Must be the same length as the source nodes.
+        axis (str): The axis to mirror. Default is 'x'.
+        mirror_position (bool): Whether to mirror position. Default is True.
+        mirror_rotation (bool): Whether to mirror rotation. Default is True.
+    """
+    if not source_nodes or not target_nodes:
+        raise ValueError("Node is not specified.")
+
+    if len(source_nodes) != len(target_nodes):
+        raise ValueError("Source and target nodes must be the same length.")
+
     # Check the node
-    if not cmds.objExists(source_node) or not cmds.objExists(target_node):
-        cmds.error(f"Node does not exist: {source_node} or {target_node}")
+    for source_node, target_node in zip(source_nodes, target_nodes, strict=True):
+        if not cmds.objExists(source_node) or not cmds.objExists(target_node):
+            cmds.error(f"Node does not exist: {source_node} or {target_node}")
 
-    if axis not in ["x", "y", "z"]:
+    if axis not in _MIRROR_MATRICES:
         raise ValueError(f"Invalid axis: {axis}")
 
     if not mirror_position and not mirror_rotation:
         raise ValueError("Position and rotation are both False")
 
-    # Check target node attributes
-    transform_attribute = ["translateX", "translateY", "translateZ", "rotateX", "rotateY", "rotateZ", "scaleX", "scaleY", "scaleZ"]
-    lock_handler = lib_attribute.AttributeLockHandler()
-    lock_handler.stock_lock_attrs(target_node, transform_attribute, include_parent=True)
-    not_modifiable_attrs = [attr for attr in transform_attribute if not lib_attribute.is_modifiable(target_node, attr)]
-    if not_modifiable_attrs:
-        raise ValueError(f"Target node attributes are not modifiable: {target_node} -> {not_modifiable_attrs}")
+    # Compute the mirrored transforms
+    mirror_matrix = _MIRROR_MATRICES[axis]
+    selection_list = om.MSelectionList()
+    xform_kwargs_list = []
+    for source_node in source_nodes:
+        selection_list.clear()
+        selection_list.add(source_node)
+        transform_mat = om.MTransformationMatrix(selection_list.getDagPath(0).inclusiveMatrix() * mirror_matrix)
+
+        xform_kwargs = {"worldSpace": True}
+        if mirror_position:
+            xform_kwargs["translation"] = transform_mat.translation(om.MSpace.kWorld)
+
+        if mirror_rotation:
+            rotation = transform_mat.rotation()
+            xform_kwargs["rotation"] = (rotation.x * _RAD2DEG, rotation.y * _RAD2DEG, rotation.z * _RAD2DEG)
+            xform_kwargs["scale"] = transform_mat.scale(om.MSpace.kWorld)
+
+        xform_kwargs_list.append(xform_kwargs)
 
     # Mirror the transform
-    world_matrix = cmds.getAttr(f"{source_node}.worldMatrix")
-    world_matrix = om.MMatrix(world_matrix)
-
-    if axis == "x":
-        mirror_matrix = om.MMatrix([[-1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]])
-    elif axis == "y":
-        mirror_matrix = om.MMatrix([[1, 0, 0, 0], [0, -1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]])
-    else:
-        mirror_matrix = om.MMatrix([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, -1, 0], [0, 0, 0, 1]])
-
-    new_matrix = world_matrix * mirror_matrix
-    transform_mat = om.MTransformationMatrix(new_matrix)
-    position = transform_mat.translation(om.MSpace.kWorld)
-    rotation = transform_mat.rotation()
-    rotation = [math.degrees(angle) for angle in [rotation.x, rotation.y, rotation.z]]
-    scale = transform_mat.scale(om.MSpace.kWorld)
-
-    if mirror_position:
-        cmds.xform(target_node, translation=position, worldSpace=True)
-        logger.debug(f"Mirrored position: {source_node} -> {target_node}")
-
-    if mirror_rotation:
-        cmds.xform(target_node, rotation=rotation, scale=scale, worldSpace=True)
-        logger.debug(f"Mirrored rotation: {source_node} -> {target_node}")
-
-    lock_handler.restore_lock_attrs(target_node)
+    transform_attribute = ["translateX", "translateY", "translateZ", "rotateX", "rotateY", "rotateZ", "scaleX", "scaleY", "scaleZ"]
+    for source_node, target_node, xform_kwargs in zip(source_nodes, target_nodes, xform_kwargs_list, strict=True):
+        # Check target node attributes
+        lock_handler = lib_attribute.AttributeLockHandler()
+        lock_handler.stock_lock_attrs(target_node, transform_attribute, include_parent=True)
+        not_modifiable_attrs = [attr for attr in transform_attribute if not lib_attribute.is_modifiable(target_node, attr)]
+        if not_modifiable_attrs:
+            raise ValueError(f"Target node attributes are not modifiable: {target_node} -> {not_modifiable_attrs}")
+
+        cmds.xform(target_node, **xform_kwargs)
+
+        if mirror_position:
+            logger.debug(f"Mirrored position: {source_node} -> {target_node}")
+
+        if mirror_rotation:
+            logger.debug(f"Mirrored rotation: {source_node} -> {target_node}")
+
+        lock_handler.restore_lock_attrs(target_node)
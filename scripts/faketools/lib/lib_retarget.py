@@ -5,9 +5,7 @@ Retargeting functions.
 from logging import getLogger
 
 import numpy as np
-from scipy.linalg import pinv
-from scipy.sparse import csr_matrix
-from scipy.sparse.linalg import spsolve
+from scipy.linalg import lstsq, solve
 from scipy.spatial import cKDTree
 from scipy.spatial.distance import cdist
 
@@ -51,16 +49,12 @@ class RBFDeform:
         mat_a = np.c_[mat_k, mat_cc]
         mat_a = np.r_[mat_a, np.c_[mat_cct, np.zeros([4, 4])]]  # base matrix
 
-        trg_x, trg_y, trg_z = np.asarray(trg_points, dtype=self._data_type).T
-        trg_x = np.append(trg_x, [0.0, 0.0, 0.0, 0.0])
-        trg_y = np.append(trg_y, [0.0, 0.0, 0.0, 0.0])
-        trg_z = np.append(trg_z, [0.0, 0.0, 0.0, 0.0])
+        trg_xyz = np.asarray(trg_points, dtype=self._data_type)
+        trg_xyz = np.r_[trg_xyz, np.zeros([4, 3], dtype=self._data_type)]
 
-        weights_x = self._solve_weight(mat_a, trg_x)
-        weights_y = self._solve_weight(mat_a, trg_y)
-        weights_z = self._solve_weight(mat_a, trg_z)
+        weights = self._solve_weight(mat_a, trg_xyz)
 
-        return weights_x, weights_y, weights_z
+        return weights[:, 0], weights[:, 1], weights[:, 2]
 
     def compute_points(
         self, deform_points: list[list[float]], weight_x: np.ndarray, weight_y: np.ndarray, weight_z: np.ndarray
@@ -93,23 +87,25 @@ class RBFDeform:
 
         return [(float(px), float(py), float(pz)) for px, py, pz in zip(out_x, out_y, out_z, strict=False)]
 
-    def _solve_weight(self, base_matrix: csr_matrix, trg_points: np.ndarray) -> np.ndarray:
-        """Solve the system of linear equations for the RBF. Uses a sparse solver and falls back to pinv if necessary.
+    def _solve_weight(self, base_matrix: np.ndarray, trg_points: np.ndarray) -> np.ndarray:
+        """Solve the system of linear equations for the RBF. Uses a dense symmetric solver and falls back to lstsq if necessary.
+
+        Notes:
+            - The RBF base matrix is dense and symmetric, so a dense solver is used instead of a sparse one.
+            - All axes are solved at once with a single factorization.
 
         Args:
-            base_matrix (csr_matrix): The RBF base matrix.
-            trg_points (np.ndarray): The extended target array for one axis.
+            base_matrix (np.ndarray): The RBF base matrix.
+            trg_points (np.ndarray): The extended target array. Shape is (n, 3) for x, y, and z.
 
         Returns:
-            np.ndarray: The resulting weight array.
+            np.ndarray: The resulting weight array. Shape is (n, 3).
         """
-        if not isinstance(base_matrix, csr_matrix):
-            base_matrix = csr_matrix(base_matrix)
         try:
-            return spsolve(base_matrix, trg_points)
+            return solve(base_matrix, trg_points, assume_a="sym")
         except np.linalg.LinAlgError:
-            logger.warning("Singular matrix detected. Using pinv instead.")
-            return np.dot(pinv(base_matrix), trg_points)
+            logger.warning("Singular matrix detected. Using lstsq instead.")
+            return lstsq(base_matrix, trg_points)[0]
 
 
 class IndexQueryMethod:
@@ -146,10 +142,17 @@ class DistanceIndexQuery(IndexQueryMethod):
         mesh_points = np.array(mesh_points)
         positions = np.array(positions)
 
+        num_vertices = self.__num_vertices
+        use_partition = num_vertices < len(mesh_points)
+
         result_indices = []
         for position in positions:
             distances = np.linalg.norm(mesh_points - position, axis=1)
-            closest_indices = np.argsort(distances)[: self.__num_vertices]
+            if use_partition:
+                closest_indices = np.argpartition(distances, num_vertices)[:num_vertices]
+                closest_indices = closest_indices[np.argsort(distances[closest_indices])]
+            else:
+                closest_indices = np.argsort(distances)
 
             result_indices.append(closest_indices.tolist())
 
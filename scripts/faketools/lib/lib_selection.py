@@ -11,6 +11,55 @@ import maya.cmds as cmds
 logger = getLogger(__name__)
 
 
+def _list_invalid_nodes(nodes: list[str], node_type: str | None = None) -> list[str]:
+    """List the nodes that do not exist or do not match the node type.
+
+    Notes:
+        - A single cmds.ls call is used for the common case where all nodes are valid.
+        - Only the nodes that are not in the cmds.ls result are checked one by one.
+
+    Args:
+        nodes (list[str]): The node list.
+        node_type (Optional[str]): The node type (inherited types are also matched). If None, only the existence is checked.
+
+    Returns:
+        list[str]: The invalid nodes.
+    """
+    if node_type:
+        valid_nodes = cmds.ls(nodes, type=node_type) or []
+    else:
+        valid_nodes = cmds.ls(nodes) or []
+
+    valid_nodes = set(valid_nodes)
+    unresolved_nodes = [node for node in nodes if node not in valid_nodes]
+    if not unresolved_nodes:
+        return []
+
+    if node_type:
+        return [node for node in unresolved_nodes if not cmds.objExists(node) or node_type not in cmds.nodeType(node, inherited=True)]
+    else:
+        return [node for node in unresolved_nodes if not cmds.objExists(node)]
+
+
+def _get_node_types(node: str, type_cache: dict[str, list[str]]) -> list[str]:
+    """Get the inherited node types of the node.
+
+    Notes:
+        - The result is cached per node in the given cache.
+
+    Args:
+        node (str): The node name.
+        type_cache (dict[str, list[str]]): The cache of the inherited node types.
+
+    Returns:
+        list[str]: The inherited node types.
+    """
+    if node not in type_cache:
+        type_cache[node] = cmds.nodeType(node, inherited=True)
+
+    return type_cache[node]
+
+
 class NodeFilter:
     """Node selection by filter. (by type, by regex)"""
 
@@ -25,11 +74,12 @@ class NodeFilter:
         elif not isinstance(nodes, list):
             raise ValueError("Nodes must be a list.")
 
-        not_exists_nodes = [node for node in nodes if not cmds.objExists(node)]
+        not_exists_nodes = _list_invalid_nodes(nodes)
         if not_exists_nodes:
             raise ValueError(f"Nodes do not exist: {not_exists_nodes}")
 
         self.nodes = nodes
+        self._type_cache: dict[str, list[str]] = {}
 
     def by_type(self, node_type: str, **kwargs) -> list[str]:
         """Filters the nodes by the type.
@@ -47,7 +97,7 @@ class NodeFilter:
 
         nodes = []
         for node in self.nodes:
-            node_types = cmds.nodeType(node, inherited=True)
+            node_types = _get_node_types(node, self._type_cache)
             if invert_match:
                 if node_type not in node_types:
                     nodes.append(node)
@@ -100,15 +150,16 @@ class DagHierarchy:
         elif not isinstance(nodes, list):
             raise ValueError("Nodes must be a list.")
 
-        not_exists_nodes = [node for node in nodes if not cmds.objExists(node)]
+        not_exists_nodes = _list_invalid_nodes(nodes)
         if not_exists_nodes:
             cmds.error(f"Nodes do not exist: {not_exists_nodes}")
 
-        not_dag_nodes = [node for node in nodes if "dagNode" not in cmds.nodeType(node, inherited=True)]
+        not_dag_nodes = _list_invalid_nodes(nodes, node_type="dagNode")
         if not_dag_nodes:
             cmds.error(f"Nodes are not dagNode: {not_dag_nodes}")
 
         self.nodes = nodes
+        self._type_cache: dict[str, list[str]] = {}
 
     def get_parent(self) -> list[str]:
         """Get the parent nodes.
@@ -158,7 +209,7 @@ class DagHierarchy:
         """
         result_nodes = []
         for node in self.nodes:
-            if "transform" not in cmds.nodeType(node, inherited=True):
+            if "transform" not in _get_node_types(node, self._type_cache):
                 continue
 
             parent = cmds.listRelatives(node, parent=True, path=True)
@@ -216,7 +267,7 @@ class DagHierarchy:
             if node not in result_nodes:
                 result_nodes.append(node)
 
-            if "transform" not in cmds.nodeType(node, inherited=True):
+            if "transform" not in _get_node_types(node, self._type_cache):
                 return
 
             if include_shape:
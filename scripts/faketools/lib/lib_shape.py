@@ -8,6 +8,9 @@ import maya.cmds as cmds
 
 logger = getLogger(__name__)
 
+# Output and input plugs for each shape type.
+_SHAPE_PLUGS = {"mesh": ("outMesh", "inMesh"), "nurbsSurface": ("local", "create"), "nurbsCurve": ("local", "create")}
+
 
 def duplicate_original_shape(shape: str) -> str:
     """Duplicate the original shape nodes.
@@ -35,9 +38,8 @@ def duplicate_original_shape(shape: str) -> str:
     shape_type = cmds.nodeType(shape)
     transform_short_name = transform.split("|")[-1]
 
-    new_shape = cmds.createNode(shape_type, name=f"{transform_short_name}_origShape", ss=True)
-    new_transform = cmds.listRelatives(new_shape, p=True)[0]
-    new_transform = cmds.rename(new_transform, f"{transform_short_name}_orig")
+    new_transform = cmds.createNode("transform", name=f"{transform_short_name}_orig", ss=True)
+    new_shape = cmds.createNode(shape_type, name=f"{transform_short_name}_origShape", parent=new_transform, ss=True)
 
     # Copy the transform
     mat = cmds.xform(transform, q=True, ws=True, m=True)
@@ -101,14 +103,17 @@ def connect_shapes(src_shape: str, dest_shape: str, **kwargs) -> None:
     if not cmds.objExists(dest_shape):
         raise ValueError(f"Node does not exist: {dest_shape}")
 
-    if "geometryShape" not in cmds.nodeType(src_shape, inherited=True):
+    src_node_types = cmds.nodeType(src_shape, inherited=True)
+    if "geometryShape" not in src_node_types:
         raise ValueError(f"Node is not a geometryShape: {src_shape}")
 
-    if "geometryShape" not in cmds.nodeType(dest_shape, inherited=True):
+    dest_node_types = cmds.nodeType(dest_shape, inherited=True)
+    if "geometryShape" not in dest_node_types:
         raise ValueError(f"Node is not a geometryShape: {dest_shape}")
 
-    src_node_type = cmds.nodeType(src_shape)
-    dest_node_type = cmds.nodeType(dest_shape)
+    # The last inherited type is the node type itself
+    src_node_type = src_node_types[-1]
+    dest_node_type = dest_node_types[-1]
 
     if src_node_type != dest_node_type:
         raise ValueError(f"Different shape type: {src_node_type} != {dest_node_type}")
@@ -118,7 +123,7 @@ def connect_shapes(src_shape: str, dest_shape: str, **kwargs) -> None:
 
     only_copy = kwargs.get("only_copy", False)
 
-    shape_plugs = {"mesh": ["outMesh", "inMesh"], "nurbsSurface": ["local", "create"], "nurbsCurve": ["local", "create"]}
+    shape_plugs = _SHAPE_PLUGS
 
     dest_orig_shape = dest_shape
     plug_chains = cmds.geometryAttrInfo(f"{dest_shape}.{shape_plugs[src_node_type][1]}", outputPlugChain=True)
@@ -173,40 +178,26 @@ def check_topology(src_shape: str, dest_shape: str) -> bool:
         raise ValueError(f"Unsupported shape type: {src_shape} and {dest_shape}")
 
     if src_node_type == "mesh":
-        src_vtx_count = cmds.polyEvaluate(src_shape, v=True)
-        dest_vtx_count = cmds.polyEvaluate(dest_shape, v=True)
+        src_info = cmds.polyEvaluate(src_shape, v=True, e=True, f=True)
+        dest_info = cmds.polyEvaluate(dest_shape, v=True, e=True, f=True)
 
-        if src_vtx_count != dest_vtx_count:
-            logger.debug(f"Different vertex count: {src_shape} != {dest_shape}")
-            return False
-
-        src_edge_count = cmds.polyEvaluate(src_shape, e=True)
-        dest_edge_count = cmds.polyEvaluate(dest_shape, e=True)
+        if src_info == dest_info:
+            return True
 
-        if src_edge_count != dest_edge_count:
-            logger.debug(f"Different edge count: {src_shape} != {dest_shape}")
-            return False
+        for key in src_info:
+            if src_info[key] != dest_info[key]:
+                logger.debug(f"Different {key} count: {src_shape} != {dest_shape}")
 
-        src_face_count = cmds.polyEvaluate(src_shape, f=True)
-        dest_face_count = cmds.polyEvaluate(dest_shape, f=True)
-
-        if src_face_count != dest_face_count:
-            logger.debug(f"Different face count: {src_shape} != {dest_shape}")
-            return False
-
-        return True
+        return False
     elif src_node_type == "nurbsSurface":
-        src_spans_u = cmds.getAttr(f"{src_shape}.spansU")
-        dest_spans_u = cmds.getAttr(f"{dest_shape}.spansU")
+        src_spans_uv = cmds.getAttr(f"{src_shape}.spansUV")[0]
+        dest_spans_uv = cmds.getAttr(f"{dest_shape}.spansUV")[0]
 
-        if src_spans_u != dest_spans_u:
+        if src_spans_uv[0] != dest_spans_uv[0]:
             logger.debug(f"Different spansU: {src_shape} != {dest_shape}")
             return False
 
-        src_spans_v = cmds.getAttr(f"{src_shape}.spansV")
-        dest_spans_v = cmds.getAttr(f"{dest_shape}.spansV")
-
-        if src_spans_v != dest_spans_v:
+        if src_spans_uv[1] != dest_spans_uv[1]:
             logger.debug(f"Different spansV: {src_shape} != {dest_shape}")
             return False
 
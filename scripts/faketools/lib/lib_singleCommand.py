@@ -15,7 +15,9 @@ class BaseCommand(ABC):
         if not nodes:
             raise ValueError("No nodes provided")
 
-        not_exists_nodes = [node for node in nodes if not cmds.objExists(node)]
+        # A single cmds.ls call covers the common case, objExists is only used for the names that ls returned in another form
+        found_nodes = set(cmds.ls(nodes) or [])
+        not_exists_nodes = [node for node in nodes if node not in found_nodes and not cmds.objExists(node)]
         if not_exists_nodes:
             raise ValueError(f"Node does not exist: {not_exists_nodes}")
 
@@ -4,10 +4,71 @@ Transform functions.
 
 from logging import getLogger
 
+import maya.api.OpenMaya as om
 import maya.cmds as cmds
 
 logger = getLogger(__name__)
 
+# Transform attributes affected by freezing.
+_XFORM_ATTRS = ("tx", "ty", "tz", "rx", "ry", "rz", "sx", "sy", "sz")
+_JOINT_ATTRS = _XFORM_ATTRS + ("jox", "joy", "joz")
+
+# Identity values of the attributes reset by freezing (joints also fold the rotate axis into the joint orient).
+_IDENTITY_VALUES = {
+    **dict.fromkeys(("tx", "ty", "tz", "rx", "ry", "rz", "rax", "ray", "raz", "shxy", "shxz", "shyz"), 0.0),
+    **dict.fromkeys(("sx", "sy", "sz"), 1.0),
+}
+_IDENTITY_TOLERANCE = 1.0e-10
+
+
+def _get_transform_dag_paths(nodes: list[str]) -> list[om.MDagPath]:
+    """Get the dag paths of the transform nodes.
+
+    Notes:
+        - Each node is resolved with its own MSelectionList, so the dag paths are always in the order of the nodes.
+
+    Args:
+        nodes (list[str]): The transform nodes.
+
+    Raises:
+        ValueError: If any node does not exist, matches several nodes, or is not a transform node.
+
+    Returns:
+        list[om.MDagPath]: The dag paths of the nodes.
+    """
+    dag_paths = []
+    not_exists_nodes = []
+    not_unique_nodes = []
+    not_transform_nodes = []
+    for node in nodes:
+        selection_list = om.MSelectionList()
+        try:
+            selection_list.add(node)
+        except RuntimeError:
+            not_exists_nodes.append(node)
+            continue
+
+        if selection_list.length() != 1:
+            not_unique_nodes.append(node)
+            continue
+
+        if not selection_list.getDependNode(0).hasFn(om.MFn.kTransform):
+            not_transform_nodes.append(node)
+            continue
+
+        dag_paths.append(selection_list.getDagPath(0))
+
+    if not_exists_nodes:
+        raise ValueError(f"Nodes do not exist: {not_exists_nodes}")
+
+    if not_unique_nodes:
+        raise ValueError(f"Nodes are not unique: {not_unique_nodes}")
+
+    if not_transform_nodes:
+        raise ValueError(f"Nodes are not transform nodes: {not_transform_nodes}")
+
+    return dag_paths
+
 
 class FreezeTransformNode:
     def __init__(self, node: str):
@@ -22,13 +83,17 @@ class FreezeTransformNode:
         if not node or not isinstance(node, str):
             raise ValueError("Node is not specified or not a string.")
 
-        if not cmds.objExists(node):
-            raise ValueError(f"Node does not exist: {node}")
+        selection_list = om.MSelectionList()
+        try:
+            selection_list.add(node)
+        except RuntimeError as e:
+            raise ValueError(f"Node does not exist: {node}") from e
 
-        if "transform" not in cmds.nodeType(node, inherited=True):
+        if not selection_list.getDependNode(0).hasFn(om.MFn.kTransform):
             raise ValueError(f"Node is not a transform: {node}")
 
         self.node = node
+        self._dag_path = selection_list.getDagPath(0)
 
     def _unlock_and_lock(func):
         """Decorator to unlock and lock the locked attributes."""
@@ -36,26 +101,22 @@ class FreezeTransformNode:
         def wrapper(self, *args, **kwargs):
             """ """
             # Check isConnected
-            connected_state = False
-            for attr in ["tx", "ty", "tz", "rx", "ry", "rz", "sx", "sy", "sz"]:
-                if cmds.connectionInfo(f"{self.node}.{attr}", isDestination=True):
+            fn = om.MFnDependencyNode(self._dag_path.node())
+            for attr in _XFORM_ATTRS:
+                if fn.findPlug(attr, False).isDestination:
                     logger.debug(f"Connected attribute: {self.node}.{attr}")
-                    connected_state = True
                     return
 
-            if connected_state:
-                cmds.error(f"Failed to freeze transform because connections exist: {self.node}")
-
             # Check locked attributes
-            locked_attrs = cmds.listAttr(self.node, locked=True) or []
+            locked_plugs = [f"{self.node}.{attr}" for attr in cmds.listAttr(self.node, locked=True) or []]
 
-            for attr in locked_attrs:
-                cmds.setAttr(f"{self.node}.{attr}", lock=False)
+            for plug in locked_plugs:
+                cmds.setAttr(plug, lock=False)
             try:
                 func(self, *args, **kwargs)
             finally:
-                for attr in locked_attrs:
-                    cmds.setAttr(f"{self.node}.{attr}", lock=True)
+                for plug in locked_plugs:
+                    cmds.setAttr(plug, lock=True)
 
         return wrapper
 
@@ -65,39 +126,48 @@ class FreezeTransformNode:
 
         Notes:
             - Even if the transform attributes of the children are locked, they will be forcibly unlocked and processed.
+            - The hierarchy and the lock states are read with the API, the lock states are changed with cmds to keep them undoable.
+            - If the node and all its children are already identity, makeIdentity is skipped.
         """
-        nodes = cmds.listRelatives(self.node, ad=True, path=True, type="transform") or []
-        nodes.append(self.node)
+        # Collect the locked plugs and check whether there is anything to freeze
+        locked_plugs = []
+        is_identity = True
+        dag_iter = om.MItDag()
+        dag_iter.reset(self._dag_path, om.MItDag.kDepthFirst, om.MFn.kTransform)
+        while not dag_iter.isDone():
+            dag_path = dag_iter.getPath()
+            fn = om.MFnDependencyNode(dag_path.node())
+            attrs = _JOINT_ATTRS if dag_path.hasFn(om.MFn.kJoint) else _XFORM_ATTRS
+
+            locked_attrs = [attr for attr in attrs if fn.findPlug(attr, False).isLocked]
+            if locked_attrs:
+                node = dag_path.partialPathName()
+                locked_plugs.extend(f"{node}.{attr}" for attr in locked_attrs)
+
+            if is_identity:
+                is_identity = all(abs(fn.findPlug(attr, False).asDouble() - value) <= _IDENTITY_TOLERANCE for attr, value in _IDENTITY_VALUES.items())
+
+            dag_iter.next()
+
+        if is_identity:
+            logger.debug(f"Already identity, skip freeze transform: {self.node}")
+            return
 
         # Unlock the locked attributes
-        locked_data = {}
-        for node in nodes:
-            attrs = ["tx", "ty", "tz", "rx", "ry", "rz", "sx", "sy", "sz", "jox", "joy", "joz"]
-            locked_attrs = []
-            for attr in attrs:
-                if cmds.nodeType(node) == "joint":
-                    if cmds.getAttr(f"{node}.{attr}", lock=True):
-                        locked_attrs.append(attr)
-                        cmds.setAttr(f"{node}.{attr}", lock=False)
-                else:
-                    if attr in ["jox", "joy", "joz"]:
-                        continue
-                    if cmds.getAttr(f"{node}.{attr}", lock=True):
-                        locked_attrs.append(attr)
-                        cmds.setAttr(f"{node}.{attr}", lock=False)
+        for plug in locked_plugs:
+            cmds.setAttr(plug, lock=False)
 
-            if locked_attrs:
-                locked_data[node] = locked_attrs
-                logger.debug(f"Unlocked attributes: {node} -> {locked_attrs}")
+        if locked_plugs:
+            logger.debug(f"Unlocked attributes: {locked_plugs}")
 
         # Freeze the transform
-        cmds.makeIdentity(self.node, apply=True, t=True, r=True, s=True, n=0, pn=True)
-        logger.debug(f"Freeze transform: {self.node}")
-
-        # Lock the locked attributes
-        for node, attrs in locked_data.items():
-            for attr in attrs:
-                cmds.setAttr(f"{node}.{attr}", lock=True)
+        try:
+            cmds.makeIdentity(self.node, apply=True, t=True, r=True, s=True, n=0, pn=True)
+            logger.debug(f"Freeze transform: {self.node}")
+        finally:
+            # Lock the locked attributes
+            for plug in locked_plugs:
+                cmds.setAttr(plug, lock=True)
 
     @_unlock_and_lock
     def freeze_pivot(self) -> None:
@@ -124,13 +194,20 @@ class FreezeTransformNode:
             freeze_transform (bool, optional): If True, freeze the transform. Defaults to False.
             freeze_pivot (bool, optional): If True, freeze the pivot. Defaults to False.
             freeze_vertex (bool, optional): If True, freeze the vertex. Defaults to False.
+
+        Notes:
+            - All lock changes and freezes are recorded in a single undo chunk.
         """
-        if freeze_transform:
-            self.freeze_transform()
-        if freeze_pivot:
-            self.freeze_pivot()
-        if freeze_vertex:
-            self.freeze_vertex()
+        cmds.undoInfo(openChunk=True, chunkName="Freeze Node")
+        try:
+            if freeze_transform:
+                self.freeze_transform()
+            if freeze_pivot:
+                self.freeze_pivot()
+            if freeze_vertex:
+                self.freeze_vertex()
+        finally:
+            cmds.undoInfo(closeChunk=True)
 
 
 class TransformHierarchy:
@@ -152,6 +229,8 @@ class TransformHierarchy:
     def __init__(self):
         """Constructor."""
         self._hierarchy = {}
+        self._ancestor_tokens: dict[str, list[str]] = {}
+        self._long_paths: dict[str, str] = {}
 
     @classmethod
     def set_hierarchy_data(cls, data: dict) -> "TransformHierarchy":
@@ -220,11 +299,17 @@ class TransformHierarchy:
         if node in self._hierarchy:
             cmds.warning(f"Node is already registered. Overwrite: {node}")
 
+            register_parent = self._hierarchy[node]["register_parent"]
+            if register_parent in self._hierarchy and node in self._hierarchy[register_parent]["register_children"]:
+                self._hierarchy[register_parent]["register_children"].remove(node)
+
         parent_node = cmds.listRelatives(node, parent=True, path=True)
         child_nodes = cmds.listRelatives(node, children=True, path=True) or []
 
         full_path = cmds.ls(node, long=True)[0]
-        depth = len(full_path.split("|")) - 1
+        depth = full_path.count("|")
+        self._ancestor_tokens.pop(node, None)
+        self._long_paths[node] = full_path
 
         self._hierarchy[node] = {
             "parent": parent_node and parent_node[0] or None,
@@ -234,37 +319,151 @@ class TransformHierarchy:
             "depth": depth,
         }
 
-        self.__update_register_hierarchy()
+        self.__update_register_hierarchy(node)
 
         logger.debug(f"Registered node: {node}")
 
-    def __update_register_hierarchy(self) -> None:
-        """Update the registered hierarchy in the data.
+    def register_nodes(self, nodes: list[str]) -> None:
+        """Register the nodes to the hierarchy at once.
+
+        Notes:
+            - The nodes are resolved to dag paths with the API, and the long paths, parent and children are read from them.
+            - The registered hierarchy is rebuilt only once after all nodes are registered.
+
+        Args:
+            nodes (list[str]): The target nodes.
+        """
+        if not nodes:
+            raise ValueError("Nodes are not specified.")
+
+        nodes = list(dict.fromkeys(nodes))
+        dag_paths = _get_transform_dag_paths(nodes)
+
+        for node, dag_path in zip(nodes, dag_paths, strict=True):
+            if node in self._hierarchy:
+                cmds.warning(f"Node is already registered. Overwrite: {node}")
+
+            long_path = dag_path.fullPathName()
+            self._ancestor_tokens.pop(node, None)
+            self._long_paths[node] = long_path
+
+            parent_path = om.MDagPath(dag_path)
+            parent_path.pop()
+            parent_node = parent_path.partialPathName() if parent_path.length() else None
+
+            child_nodes = []
+            for i in range(dag_path.childCount()):
+                child_path = om.MDagPath(dag_path)
+                child_path.push(dag_path.child(i))
+                child_nodes.append(child_path.partialPathName())
+
+            self._hierarchy[node] = {
+                "parent": parent_node,
+                "children": child_nodes,
+                "register_parent": None,
+                "register_children": [],
+                "depth": long_path.count("|"),
+            }
+
+        self.__update_register_hierarchy(full=True)
+
+        logger.debug(f"Registered nodes: {nodes}")
+
+    def __get_long_path(self, node: str) -> str:
+        """Get the cached long path of the registered node.
+
+        Notes:
+            - The long paths are kept on the instance and are not part of the hierarchy data.
+            - Nodes loaded by set_hierarchy_data are queried from the current scene and cached.
 
         Args:
             node (str): The target node.
+
+        Returns:
+            str: The long path of the node.
         """
-        # Clear the registered hierarchy
-        for node in self._hierarchy:
-            self._hierarchy[node]["register_parent"] = None
-            self._hierarchy[node]["register_children"] = []
-
-        # Update the registered hierarchy
-        for node in self._hierarchy:
-            parent = self._hierarchy[node]["parent"]
-            if not parent:
-                continue
+        long_path = self._long_paths.get(node)
+        if long_path is None:
+            long_path = cmds.ls(node, long=True)[0]
+            self._long_paths[node] = long_path
+
+        return long_path
+
+    def __find_register_parent(self, node: str) -> str | None:
+        """Find the nearest registered ancestor of the node.
+
+        Args:
+            node (str): The target node.
+
+        Returns:
+            str | None: The registered parent node. None if no ancestor is registered.
+        """
+        if not self._hierarchy[node]["parent"]:
+            return None
+
+        parent_nodes = self._ancestor_tokens.get(node)
+        if parent_nodes is None:
+            parent_nodes = self.__get_long_path(node).split("|")[1:-1]
+            self._ancestor_tokens[node] = parent_nodes
+
+        for parent_node in reversed(parent_nodes):
+            if parent_node in self._hierarchy:
+                return parent_node
+
+        return None
+
+    def __set_register_parent(self, node: str, register_parent: str | None) -> None:
+        """Set the registered parent of the node and update the registered children of the parents.
+
+        Args:
+            node (str): The target node.
+            register_parent (str | None): The registered parent node.
+        """
+        current_parent = self._hierarchy[node]["register_parent"]
+        if current_parent == register_parent and (not register_parent or node in self._hierarchy[register_parent]["register_children"]):
+            return
+
+        if current_parent in self._hierarchy and node in self._hierarchy[current_parent]["register_children"]:
+            self._hierarchy[current_parent]["register_children"].remove(node)
 
-            full_path = cmds.ls(node, long=True)[0]
-            parent_nodes = full_path.split("|")[1:-1]
+        self._hierarchy[node]["register_parent"] = register_parent
+        if register_parent:
+            self._hierarchy[register_parent]["register_children"].append(node)
 
-            for parent_node in reversed(parent_nodes):
-                if parent_node in self._hierarchy:
-                    self._hierarchy[node]["register_parent"] = parent_node
-                    self._hierarchy[parent_node]["register_children"].append(node)
+            logger.debug(f"Updated register hierarchy: {node} -> Parent: {register_parent}, Children: {node}")
 
-                    logger.debug(f"Updated register hierarchy: {node} -> Parent: {parent_node}, Children: {node}")
-                    break
+    def __update_register_hierarchy(self, node: str | None = None, full: bool = False) -> None:
+        """Update the registered hierarchy in the data.
+
+        Notes:
+            - If the node is specified, only the node and the registered nodes under it are updated.
+            - If full is True or the node is not specified, all registered nodes are updated.
+
+        Args:
+            node (str | None): The newly registered node.
+            full (bool): Whether to rebuild the whole registered hierarchy. Default is False.
+        """
+        if full or node is None:
+            # Clear the registered hierarchy
+            for target_node in self._hierarchy:
+                self._hierarchy[target_node]["register_parent"] = None
+                self._hierarchy[target_node]["register_children"] = []
+
+            # Update the registered hierarchy
+            for target_node in self._hierarchy:
+                self.__set_register_parent(target_node, self.__find_register_parent(target_node))
+
+            return
+
+        self.__set_register_parent(node, self.__find_register_parent(node))
+
+        # The registered nodes under the node may now have the node as the nearest registered ancestor
+        node_token = f"|{node}|"
+        for target_node in self._hierarchy:
+            if target_node == node or node_token not in self.__get_long_path(target_node):
+                continue
+
+            self.__set_register_parent(target_node, self.__find_register_parent(target_node))
 
     def get_parent(self, node: str) -> str:
         """Get the parent node of the node.
@@ -355,16 +554,12 @@ def reorder_transform_nodes(nodes: list[str]) -> list:
     if not nodes:
         raise ValueError("Nodes are not specified.")
 
-    not_transform_nodes = [node for node in nodes if "transform" not in cmds.nodeType(node, inherited=True)]
-    if not_transform_nodes:
-        raise ValueError(f"Nodes are not transform nodes: {not_transform_nodes}")
+    unique_nodes = list(dict.fromkeys(nodes))
+    dag_paths = _get_transform_dag_paths(unique_nodes)
 
-    depth_dict = {}
-    for node in nodes:
-        depth = len(cmds.ls(node, long=True)[0].split("|")) - 1
-        depth_dict[node] = depth
+    depth_dict = {node: dag_path.fullPathName().count("|") for node, dag_path in zip(unique_nodes, dag_paths, strict=True)}
 
-    sorted_nodes = sorted(nodes, key=lambda x: depth_dict[x])
+    sorted_nodes = sorted(nodes, key=depth_dict.get)
 
     return sorted_nodes
 
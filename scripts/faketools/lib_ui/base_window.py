@@ -21,6 +21,12 @@ except ImportError:
         QWidget,
     )
 
+# Layout margin pixel metrics (left, top, right, bottom), resolved on first use.
+_LAYOUT_MARGIN_METRICS = None
+
+# Widget used by get_spacing when no widget is given, created on first use.
+_DEFAULT_WIDGET = None
+
 
 class BaseMainWindow(QMainWindow):
     def __init__(self, parent=None, object_name: str = "MainWindow", window_title: str = "Main Window", central_layout: str = "vertical"):
@@ -47,16 +53,37 @@ class BaseMainWindow(QMainWindow):
         self.central_layout.setSpacing(int(default_widget_spacing * 0.75))
 
 
-def get_spacing(widget: QWidget, direction: str = "vertical") -> int:
+def get_spacing(widget: QWidget | None = None, direction: str = "vertical") -> int:
     """Get default widget spacing.
 
     Args:
-        widget (QWidget): Widget. Default is QWidget().
+        widget (QWidget | None): Widget. Default is None, a shared plain QWidget is used.
         direction (str): Direction. Default is 'vertical'. 'horizontal' is also available.
     """
-    return QApplication.style().layoutSpacing(
-        widget.sizePolicy().controlType(), widget.sizePolicy().controlType(), direction == "vertical" and Qt.Vertical or Qt.Horizontal
-    )
+    if widget is None:
+        widget = _get_default_widget()
+
+    control_type = widget.sizePolicy().controlType()
+    orientation = Qt.Vertical if direction == "vertical" else Qt.Horizontal
+
+    return QApplication.style().layoutSpacing(control_type, control_type, orientation)
+
+
+def _get_default_widget() -> QWidget:
+    """Get the shared widget used for default style queries.
+
+    Notes:
+        - The widget is created lazily, so that no QWidget is created before the QApplication exists.
+
+    Returns:
+        QWidget: The shared widget.
+    """
+    global _DEFAULT_WIDGET
+
+    if _DEFAULT_WIDGET is None:
+        _DEFAULT_WIDGET = QWidget()
+
+    return _DEFAULT_WIDGET
 
 
 def get_margins(widget: QWidget) -> tuple:
@@ -68,19 +95,20 @@ def get_margins(widget: QWidget) -> tuple:
     Returns:
         tuple: A tuple of four integers representing (left, top, right, bottom) margins.
     """
+    global _LAYOUT_MARGIN_METRICS
+
     # Get the style for the widget
     style = QApplication.style()
 
+    # Resolve the pixel metric enums once (PySide2 exposes them on the style, PySide6 on QStyle.PixelMetric)
+    if _LAYOUT_MARGIN_METRICS is None:
+        pixel_metric = style if hasattr(style, "PM_LayoutLeftMargin") else style.PixelMetric
+        _LAYOUT_MARGIN_METRICS = (
+            pixel_metric.PM_LayoutLeftMargin,
+            pixel_metric.PM_LayoutTopMargin,
+            pixel_metric.PM_LayoutRightMargin,
+            pixel_metric.PM_LayoutBottomMargin,
+        )
+
     # Retrieve default margins from the style
-    left_margin_style = style.PM_LayoutLeftMargin if hasattr(style, "PM_LayoutLeftMargin") else style.PixelMetric.PM_LayoutLeftMargin
-    top_margin_style = style.PM_LayoutTopMargin if hasattr(style, "PM_LayoutTopMargin") else style.PixelMetric.PM_LayoutTopMargin
-    right_margin_style = style.PM_LayoutRightMargin if hasattr(style, "PM_LayoutRightMargin") else style.PixelMetric.PM_LayoutRightMargin
-    bottom_margin_style = style.PM_LayoutBottomMargin if hasattr(style, "PM_LayoutBottomMargin") else style.PixelMetric.PM_LayoutBottomMargin
-
-    left = style.pixelMetric(left_margin_style, None, widget)
-    top = style.pixelMetric(top_margin_style, None, widget)
-    right = style.pixelMetric(right_margin_style, None, widget)
-    bottom = style.pixelMetric(bottom_margin_style, None, widget)
-
-    # Return as a tuple
-    return (left, top, right, bottom)
+    return tuple(style.pixelMetric(metric, None, widget) for metric in _LAYOUT_MARGIN_METRICS)
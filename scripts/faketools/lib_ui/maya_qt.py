@@ -79,14 +79,16 @@ def delete_widget(obj_name: str) -> None:
     """
     if not obj_name:
         return
+
+    pattern = re.compile(obj_name)
+
     widgets = QApplication.topLevelWidgets()
     for w in widgets:
-        try:
-            this_name = w.objectName()
-            if not this_name:
-                continue
-            if re.search(obj_name, this_name):
-                w.close()
-                break
-        except Exception:
+        # Skip widgets whose C++ object has already been deleted
+        if not shiboken.isValid(w):
             continue
+
+        this_name = w.objectName()
+        if this_name and pattern.search(this_name):
+            w.close()
+            break
@@ -2,34 +2,51 @@
 Maya-specific functions in UI.
 """
 
+from functools import wraps
 import traceback
 
-from maya.api.OpenMaya import MGlobal
+from maya.api.OpenMaya import MGlobal, MSelectionList
 import maya.cmds as cmds
 import maya.mel as mel
 
+# Names of the main channel box and progress bar controls, resolved on first use.
+_CHANNEL_BOX = None
+_MAIN_PROGRESS_BAR = None
+
+# Modifier key bits returned by cmds.getModifiers (Caps Lock is 2 and is ignored).
+_SHIFT = 1
+_CTRL = 4
+_ALT = 8
+_COMMAND = 16
+_MODIFIERS = _SHIFT | _CTRL | _ALT | _COMMAND
+
 
 class Undo:
-    """Context manager for undo chunk."""
+    """Context manager for undo chunk.
+
+    Notes:
+        - Only the outermost context opens and closes the undo chunk, nested contexts are merged into it.
+        - The instance holds no state, so one instance can be reused and entered recursively.
+    """
+
+    __slots__ = ("name",)
 
-    open_chunk = True
+    _depth = 0
 
     def __init__(self, operation_name="operation"):
         self.name = operation_name
-        self.close_chunk = False
 
     def __enter__(self):
-        if Undo.open_chunk:
-            self.close_chunk = True
-            Undo.open_chunk = False
+        if Undo._depth == 0:
             cmds.undoInfo(openChunk=True, chunkName=self.name)
+        Undo._depth += 1
 
         return self
 
     def __exit__(self, typ, value, trace):
-        if self.close_chunk:
+        Undo._depth -= 1
+        if Undo._depth == 0:
             cmds.undoInfo(closeChunk=True)
-            Undo.open_chunk = True
 
 
 def undo_chunk(chunk_name):
@@ -43,9 +60,15 @@ def undo_chunk(chunk_name):
     """
 
     def deco(func):
+        undo = Undo(chunk_name)
+
+        @wraps(func)
         def wrap(*args, **kwargs):
-            with Undo(chunk_name):
+            undo.__enter__()
+            try:
                 return func(*args, **kwargs)
+            finally:
+                undo.__exit__(None, None, None)
 
         return wrap
 
@@ -62,6 +85,7 @@ def without_undo(func):
         function: Decorated function.
     """
 
+    @wraps(func)
     def wrap(*args, **kwargs):
         cmds.undoInfo(stateWithoutFlush=False)
         try:
@@ -82,6 +106,7 @@ def error_handler(func):
         function: Decorated function.
     """
 
+    @wraps(func)
     def wrap(*args, **kwargs):
         try:
             return func(*args, **kwargs)
@@ -102,34 +127,86 @@ def selection_handler(func):
         function: Decorated function.
     """
 
+    @wraps(func)
     def wrap(*args, **kwargs):
-        sel_nodes = cmds.ls(sl=True)
+        selection_list = MGlobal.getActiveSelectionList()
         result_nodes = func(*args, **kwargs)
 
-        mod_keys = get_modifiers()
-        if not mod_keys:
+        mods = get_modifier_mask()
+        if not mods:
             cmds.select(result_nodes, r=True)
-        elif mod_keys == ["Shift", "Ctrl"]:
-            cmds.select(sel_nodes, r=True)
-            cmds.select(result_nodes, add=True)
-        elif "Shift" in mod_keys:
-            cmds.select(sel_nodes, r=True)
-            cmds.select(result_nodes, tgl=True)
-        elif "Ctrl" in mod_keys:
-            cmds.select(sel_nodes, r=True)
-            cmds.select(result_nodes, d=True)
+            return
+
+        if mods == _SHIFT | _CTRL:
+            strategy = MSelectionList.kMergeNormal
+        elif mods & _SHIFT:
+            strategy = MSelectionList.kXORWithList
+        elif mods & _CTRL:
+            strategy = MSelectionList.kRemoveFromList
+        else:
+            return
+
+        # Merge the result into the previous selection with the API and select it once, so selection changed callbacks fire once.
+        # The API merges components by index, so component ranges are added, toggled and removed like cmds.select does.
+        result_list = MSelectionList()
+        for node in result_nodes or []:
+            try:
+                result_list.add(node)
+            except RuntimeError as e:
+                raise ValueError(f"No object matches name: {node}") from e
+
+        selection_list.merge(result_list, strategy)
+
+        final_nodes = selection_list.getSelectionStrings()
+        if final_nodes:
+            cmds.select(final_nodes, r=True)
+        else:
+            cmds.select(cl=True)
 
     return wrap
 
 
+def _get_channel_box() -> str:
+    """Get the name of the main channel box.
+
+    Notes:
+        - The name does not change during a session, so the mel global is evaluated only once.
+
+    Returns:
+        str: The channel box name.
+    """
+    global _CHANNEL_BOX
+
+    if _CHANNEL_BOX is None:
+        _CHANNEL_BOX = mel.eval("$temp=$gChannelBoxName")
+
+    return _CHANNEL_BOX
+
+
+def _get_main_progress_bar() -> str:
+    """Get the name of the main progress bar.
+
+    Notes:
+        - The name does not change during a session, so the mel global is evaluated only once.
+
+    Returns:
+        str: The progress bar name.
+    """
+    global _MAIN_PROGRESS_BAR
+
+    if _MAIN_PROGRESS_BAR is None:
+        _MAIN_PROGRESS_BAR = mel.eval("$tmp = $gMainProgressBar")
+
+    return _MAIN_PROGRESS_BAR
+
+
 def get_channels(long_name=True) -> list[str]:
     """Get attribute names from the channel box.
 
     Returns:
         list[str]: Attribute names.
     """
-    g_channel_box = mel.eval("$temp=$gChannelBoxName")
-    channels = cmds.channelBox(g_channel_box, q=True, sma=True)
+    channels = cmds.channelBox(_get_channel_box(), q=True, sma=True)
 
     if not channels:
         return []
@@ -137,8 +214,24 @@ def get_channels(long_name=True) -> list[str]:
     if not long_name:
         return channels
     else:
-        sel_nodes = cmds.ls(sl=True)
-        return [cmds.attributeQuery(ch, n=sel_nodes[-1], ln=True) for ch in channels]
+        node = cmds.ls(sl=True)[-1]
+
+        # Map short names to long names with two listAttr calls instead of one attributeQuery per channel
+        long_names = dict(zip(cmds.listAttr(node, shortNames=True) or [], cmds.listAttr(node) or [], strict=False))
+
+        return [long_names.get(ch) or cmds.attributeQuery(ch, n=node, ln=True) for ch in channels]
+
+
+def get_modifier_mask() -> int:
+    """Get the current modifier keys as a bit mask.
+
+    Notes:
+        - Shift is 1, Ctrl is 4, Alt is 8 and Command/Windows is 16. Caps Lock is masked out.
+
+    Returns:
+        int: Modifier key bits.
+    """
+    return cmds.getModifiers() & _MODIFIERS
 
 
 def get_modifiers() -> list[str]:
@@ -147,31 +240,48 @@ def get_modifiers() -> list[str]:
     Returns:
         list[str]: Modifier keys.
     """
-    mods = cmds.getModifiers()
+    mods = get_modifier_mask()
     keys = []
-    if (mods & 1) > 0:
+    if mods & _SHIFT:
         keys.append("Shift")
-    if (mods & 4) > 0:
+    if mods & _CTRL:
         keys.append("Ctrl")
-    if (mods & 8) > 0:
+    if mods & _ALT:
         keys.append("Alt")
-    if mods & 16:
+    if mods & _COMMAND:
         keys.append("Command/Windows")
 
     return keys
 
 
 class progress_bar:
+    __slots__ = ("pBar", "poll_interval", "_pending")
+
     def __init__(self, maxVal, **kwargs):
+        """Constructor.
+
+        Args:
+            maxVal (int): The maximum value of the progress bar.
+            message (str, optional): The status message. ``msg`` is also accepted. Defaults to "Calculation ...".
+            poll_interval (int, optional): The number of breakPoint calls between cancel checks and progress updates.
+                Use a larger value for loops with many cheap iterations. Defaults to 1.
+        """
         msg = kwargs.get("message", kwargs.get("msg", "Calculation ..."))
-        self.pBar = mel.eval("$tmp = $gMainProgressBar")
+        self.poll_interval = max(1, kwargs.get("poll_interval", 1))
+        self._pending = 0
+        self.pBar = _get_main_progress_bar()
         cmds.progressBar(self.pBar, e=True, beginProgress=True, isInterruptable=True, status=msg, maxValue=maxVal)
 
     def breakPoint(self):
+        self._pending += 1
+        if self._pending < self.poll_interval:
+            return False
+
         if cmds.progressBar(self.pBar, q=True, isCancelled=True):
             return True
         else:
-            cmds.progressBar(self.pBar, e=True, step=1)
+            cmds.progressBar(self.pBar, e=True, step=self._pending)
+            self._pending = 0
 
     def __enter__(self):
         return self
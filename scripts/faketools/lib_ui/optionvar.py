@@ -11,6 +11,8 @@ import maya.cmds as cmds
 class ToolOptionSettings:
     """A class to save and read tool settings in optionVar."""
 
+    __slots__ = ("tool_name",)
+
     def __init__(self, tool_name: str):
         """Initializes the ToolOptionSettings instance.
 
@@ -2,12 +2,17 @@
 Icons for the tools.
 """
 
+from functools import cache
 import pathlib
 
 
+@cache
 def get_icon_path(picture_name: str) -> str:
     """Get the icon path.
 
+    Notes:
+        - The resolved paths are cached, missing icons are not cached and raise every time.
+
     Args:
         picture_name (str): The name of the icon including the extension.
 
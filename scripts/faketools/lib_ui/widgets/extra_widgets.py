@@ -4,7 +4,7 @@ Extra widgets for the UI.
 
 try:
     from PySide2.QtCore import Qt
-    from PySide2.QtGui import QColor, QIcon, QPixmap
+    from PySide2.QtGui import QColor, QIcon, QImageReader
     from PySide2.QtWidgets import (
         QApplication,
         QDoubleSpinBox,
@@ -14,7 +14,7 @@ try:
     )
 except ImportError:
     from PySide6.QtCore import Qt
-    from PySide6.QtGui import QColor, QIcon, QPixmap
+    from PySide6.QtGui import QColor, QIcon, QImageReader
     from PySide6.QtWidgets import (
         QApplication,
         QDoubleSpinBox,
@@ -25,6 +25,35 @@ except ImportError:
 
 from ..tool_icons import get_icon_path
 
+# Size hints of the separator lines, resolved on the first separator of each kind.
+_HLINE_HEIGHT = None
+_VLINE_WIDTH = None
+
+# QIcon objects shared by the icon buttons, keyed by icon name.
+_ICON_CACHE: dict[str, QIcon] = {}
+
+# Button margin pixel metric, resolved on first use.
+_PM_BUTTON_MARGIN = None
+
+# ToolIconButton style sheets, keyed by the packed RGBA value of the background color.
+_TOOL_ICON_BUTTON_STYLES: dict[int, str] = {}
+
+
+def _get_icon(icon_name: str) -> QIcon:
+    """Get the shared QIcon of the tool icon.
+
+    Args:
+        icon_name (str): The name of the icon.
+
+    Returns:
+        QIcon: The icon.
+    """
+    icon = _ICON_CACHE.get(icon_name)
+    if icon is None:
+        icon = _ICON_CACHE[icon_name] = QIcon(get_icon_path(icon_name))
+
+    return icon
+
 
 class HorizontalSeparator(QFrame):
     """Separator widget."""
@@ -40,7 +69,11 @@ class HorizontalSeparator(QFrame):
         self.setFrameShape(QFrame.HLine)
         self.setFrameShadow(QFrame.Sunken)
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Minimum)
-        self.setFixedHeight(self.sizeHint().height() * height_ratio)
+
+        global _HLINE_HEIGHT
+        if _HLINE_HEIGHT is None:
+            _HLINE_HEIGHT = self.sizeHint().height()
+        self.setFixedHeight(int(_HLINE_HEIGHT * height_ratio))
 
 
 class VerticalSeparator(QFrame):
@@ -58,7 +91,10 @@ class VerticalSeparator(QFrame):
         self.setFrameShadow(QFrame.Sunken)
         self.setSizePolicy(QSizePolicy.Minimum, QSizePolicy.Expanding)
 
-        self.setFixedWidth(self.sizeHint().width() * width_ratio)
+        global _VLINE_WIDTH
+        if _VLINE_WIDTH is None:
+            _VLINE_WIDTH = self.sizeHint().width()
+        self.setFixedWidth(int(_VLINE_WIDTH * width_ratio))
 
 
 class ToolIconButton(QPushButton):
@@ -67,20 +103,22 @@ class ToolIconButton(QPushButton):
     def __init__(self, icon_name, parent=None):
         super().__init__(parent=parent)
 
-        icon_path = get_icon_path(icon_name)
-        pixmap = QPixmap(icon_path)
-        icon = QIcon(icon_path)
-        self.setIcon(icon)
+        self.setIcon(_get_icon(icon_name))
 
-        palette = self.palette()
-        background_color = palette.color(self.backgroundRole())
-        style = QApplication.style()
-        pm_button_margin = style.PM_ButtonMargin if hasattr(style, "PM_ButtonMargin") else style.PixelMetric.PM_ButtonMargin
-        padding = style.pixelMetric(pm_button_margin)
-        hover_color = self._get_lightness_color(background_color, 1.2)
-        pressed_color = self._get_lightness_color(background_color, 0.5)
+        global _PM_BUTTON_MARGIN
 
-        self.setStyleSheet(f"""
+        style = QApplication.style()
+        if _PM_BUTTON_MARGIN is None:
+            _PM_BUTTON_MARGIN = style.PM_ButtonMargin if hasattr(style, "PM_ButtonMargin") else style.PixelMetric.PM_ButtonMargin
+        padding = style.pixelMetric(_PM_BUTTON_MARGIN)
+
+        # Buttons with the same background color share the style sheet
+        background_color = self.palette().color(self.backgroundRole())
+        style_sheet = _TOOL_ICON_BUTTON_STYLES.get(background_color.rgba())
+        if style_sheet is None:
+            hover_color = self._get_lightness_color(background_color, 1.2)
+            pressed_color = self._get_lightness_color(background_color, 0.5)
+            style_sheet = _TOOL_ICON_BUTTON_STYLES[background_color.rgba()] = f"""
             QPushButton {{
                 border: none;
                 background-color: {background_color.name()};
@@ -93,9 +131,12 @@ class ToolIconButton(QPushButton):
             QPushButton:pressed {{
                 background-color: {pressed_color.name()};
             }}
-        """)
+        """
 
-        size = pixmap.width() + padding
+        self.setStyleSheet(style_sheet)
+
+        # Read the image width from the file header without decoding the image
+        size = QImageReader(get_icon_path(icon_name)).size().width() + padding
         self.setMinimumSize(size, size)
 
     def _get_lightness_color(self, color, factor) -> QColor:
@@ -126,8 +167,8 @@ class CheckBoxButton(QPushButton):
         """
         super().__init__(parent=parent)
 
-        self.icon_on = QIcon(get_icon_path(icon_on))
-        self.icon_off = QIcon(get_icon_path(icon_off))
+        self.icon_on = _get_icon(icon_on)
+        self.icon_off = _get_icon(icon_off)
 
         self.setCheckable(True)
         self.setChecked(False)
@@ -184,7 +225,11 @@ class TextCheckBoxButton(QPushButton):
 
         self.font_size = font_size
 
-        self.setStyleSheet(f"background-color: {self.bg_color_off}; font-size: {self.font_size}px; font-weight: bold; border: none;")
+        # The style sheets of both states are built once and swapped on toggle
+        self._style_on = f"background-color: {self.bg_color_on}; font-size: {self.font_size}px; font-weight: bold; border: none;"
+        self._style_off = f"background-color: {self.bg_color_off}; font-size: {self.font_size}px; font-weight: bold; border: none;"
+
+        self.setStyleSheet(self._style_off)
 
         self.toggled.connect(self.update_color)
 
@@ -194,10 +239,7 @@ class TextCheckBoxButton(QPushButton):
         Args:
             checked (bool): The checked state.
         """
-        if checked:
-            self.setStyleSheet(f"background-color: {self.bg_color_on}; font-size: {self.font_size}px; font-weight: bold; border: none;")
-        else:
-            self.setStyleSheet(f"background-color: {self.bg_color_off}; font-size: {self.font_size}px; font-weight: bold; border: none;")
+        self.setStyleSheet(self._style_on if checked else self._style_off)
 
 
 class ModifierSpinBox(QDoubleSpinBox):
@@ -2,6 +2,7 @@
 
 from logging import getLogger
 
+import maya.api.OpenMaya as om
 import maya.cmds as cmds
 
 try:
@@ -10,6 +11,7 @@ try:
         QItemSelectionModel,
         QSortFilterProxyModel,
         Qt,
+        QTimer,
         Signal,
     )
     from PySide2.QtGui import QStandardItem, QStandardItemModel
@@ -28,6 +30,7 @@ except ImportError:
         QItemSelectionModel,
         QSortFilterProxyModel,
         Qt,
+        QTimer,
         Signal,
     )
     from PySide6.QtGui import QStandardItem, QStandardItemModel
@@ -45,6 +48,38 @@ from .. import base_window, maya_ui
 
 logger = getLogger(__name__)
 
+# Delay in milliseconds before the attribute filter is applied after typing.
+_FILTER_DELAY_MSEC = 150
+
+# Attributes listed first for transform nodes.
+_TRANSFORM_ATTRS = ("translateX", "translateY", "translateZ", "rotateX", "rotateY", "rotateZ", "scaleX", "scaleY", "scaleZ", "visibility")
+
+
+def _set_attribute_state(nodes: list[str], attrs: list[str], lock: bool | None = None, keyable: bool | None = None) -> None:
+    """Set the lock or keyable state of the attributes on the nodes.
+
+    Notes:
+        - The current states are read with the API, and only the plugs whose state differs are changed.
+        - The states are changed with cmds.setAttr to keep them undoable.
+
+    Args:
+        nodes (list[str]): The node names.
+        attrs (list[str]): The attribute names.
+        lock (bool | None): The lock state to set. If None, the lock state is not changed.
+        keyable (bool | None): The keyable state to set. If None, the keyable state is not changed.
+    """
+    for node in nodes:
+        selection_list = om.MSelectionList()
+        selection_list.add(node)
+        fn = om.MFnDependencyNode(selection_list.getDependNode(0))
+
+        for attr in attrs:
+            plug = fn.findPlug(attr, False)
+            if lock is not None and plug.isLocked != lock:
+                cmds.setAttr(f"{node}.{attr}", lock=lock)
+            if keyable is not None and plug.isKeyable != keyable:
+                cmds.setAttr(f"{node}.{attr}", keyable=keyable)
+
 
 class NodeListView(QListView):
     """Node list view."""
@@ -123,19 +158,21 @@ class NodeListView(QListView):
         Args:
             nodes (str): The nodes to add.
         """
-        for node in nodes:
-            item = QStandardItem(node)
-            self.node_model.appendRow(item)
+        # Append all rows at once, so the views are notified once
+        self.node_model.invisibleRootItem().appendRows([QStandardItem(node) for node in nodes])
 
         self.node_changed.emit()
 
     def replace_nodes(self, nodes: str) -> None:
         """Replace the nodes in the node list.
 
+        Notes:
+            - The model and its selection model are kept, so the connections to them stay valid.
+
         Args:
             nodes (str): The nodes to replace.
         """
-        self.node_model.clear()
+        self.node_model.removeRows(0, self.node_model.rowCount())
         self.add_nodes(nodes)
 
     def remove_nodes(self) -> None:
@@ -169,7 +206,8 @@ class NodeListView(QListView):
         Returns:
             list[str]: All the nodes.
         """
-        return [self.node_model.item(i).text() for i in range(self.node_model.rowCount())]
+        root_item = self.node_model.invisibleRootItem()
+        return [root_item.child(i).text() for i in range(root_item.rowCount())]
 
     def get_count(self) -> int:
         """Get the number of nodes.
@@ -242,9 +280,7 @@ class AttributeListView(QListView):
         if not selected_nodes or not selected_attrs:
             return
 
-        for node in selected_nodes:
-            for attr in selected_attrs:
-                cmds.setAttr(f"{node}.{attr}", lock=True)
+        _set_attribute_state(selected_nodes, selected_attrs, lock=True)
 
         self.attribute_lock_changed.emit()
 
@@ -258,9 +294,7 @@ class AttributeListView(QListView):
         if not selected_nodes or not selected_attrs:
             return
 
-        for node in selected_nodes:
-            for attr in selected_attrs:
-                cmds.setAttr(f"{node}.{attr}", lock=False)
+        _set_attribute_state(selected_nodes, selected_attrs, lock=False)
 
         self.attribute_lock_changed.emit()
 
@@ -274,9 +308,7 @@ class AttributeListView(QListView):
         if not selected_nodes or not selected_attrs:
             return
 
-        for node in selected_nodes:
-            for attr in selected_attrs:
-                cmds.setAttr(f"{node}.{attr}", keyable=True)
+        _set_attribute_state(selected_nodes, selected_attrs, keyable=True)
 
     @maya_ui.undo_chunk("Unkeyable Attributes")
     @maya_ui.error_handler
@@ -288,9 +320,7 @@ class AttributeListView(QListView):
         if not selected_nodes or not selected_attrs:
             return
 
-        for node in selected_nodes:
-            for attr in selected_attrs:
-                cmds.setAttr(f"{node}.{attr}", keyable=False)
+        _set_attribute_state(selected_nodes, selected_attrs, keyable=False)
 
     def get_selected_attributes(self) -> list[str]:
         """Get the selected attributes.
@@ -307,7 +337,8 @@ class AttributeListView(QListView):
         Returns:
             list[str]: All the attributes.
         """
-        return [self.model().item(i).text() for i in range(self.model().rowCount())]
+        root_item = self.attribute_source_model.invisibleRootItem()
+        return [root_item.child(i).text() for i in range(root_item.rowCount())]
 
 
 class NodeAttributeWidgets(QWidget):
@@ -337,9 +368,23 @@ class NodeAttributeWidgets(QWidget):
 
         self.setLayout(self.main_layout)
 
+        # Nodes whose attributes are currently displayed
+        self._displayed_nodes = None
+
+        # Apply the filter once typing pauses instead of on every keystroke
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(_FILTER_DELAY_MSEC)
+
         # Signal & Slot
         load_button.clicked.connect(self._list_nodes)
-        self.filter_line_edit.textChanged.connect(self.attr_list.attr_model.setFilterFixedString)
+        self.node_list.selectionModel().selectionChanged.connect(self._display_attributes)
+        self.filter_line_edit.textChanged.connect(lambda: self.filter_timer.start())
+        self.filter_timer.timeout.connect(self._apply_filter)
+
+    def _apply_filter(self) -> None:
+        """Filter the attribute list with the text of the filter field."""
+        self.attr_list.attr_model.setFilterFixedString(self.filter_line_edit.text())
 
     @maya_ui.error_handler
     def _list_nodes(self) -> None:
@@ -348,6 +393,9 @@ class NodeAttributeWidgets(QWidget):
         if not sel_nodes:
             cmds.error("Please select the nodes to list.")
 
+        # Always refresh the attributes after loading
+        self._displayed_nodes = None
+
         shift_pressed = QApplication.keyboardModifiers() == Qt.ShiftModifier
         if shift_pressed:
             nodes = self.get_all_nodes()
@@ -363,9 +411,7 @@ class NodeAttributeWidgets(QWidget):
 
         self.node_list.replace_nodes(nodes)
 
-        # Connect the signal after setting the model
         selection_model = self.node_list.selectionModel()
-        selection_model.selectionChanged.connect(self._display_attributes)
 
         # Select the current selection
         if shift_pressed and selection_indexes:
@@ -375,58 +421,79 @@ class NodeAttributeWidgets(QWidget):
             selection_model.select(self.node_list.node_model.index(0, 0), QItemSelectionModel.Select)
 
     def _display_attributes(self) -> None:
-        """Display the attributes of the selected nodes."""
+        """Display the attributes of the selected nodes.
+
+        Notes:
+            - If the selected nodes are the same as the last call, the attribute list is kept as is.
+        """
+        selected_nodes = tuple(index.data() for index in self.node_list.selectionModel().selectedIndexes())
+        if selected_nodes == self._displayed_nodes:
+            return
+
+        self._displayed_nodes = selected_nodes
+
         self.attr_list.model().sourceModel().clear()
-        selected_indexes = self.node_list.selectionModel().selectedIndexes()
-        if not selected_indexes:
+        if not selected_nodes:
             return
 
-        selected_nodes = [index.data() for index in selected_indexes]
         common_attributes = self._list_attributes(selected_nodes[0])
 
         if len(selected_nodes) > 1:
+            # Intersect as sets and keep the order of the first node
+            common_set = set(common_attributes)
             for node in selected_nodes[1:]:
-                node_attrs = self._list_attributes(node)
-                common_attributes = [attr for attr in common_attributes if attr in node_attrs]
+                common_set.intersection_update(self._list_attributes(node))
+            common_attributes = [attr for attr in common_attributes if attr in common_set]
 
-        for attr in common_attributes:
-            item = QStandardItem(attr)
-            self.attr_list.model().sourceModel().appendRow(item)
+        # Append all rows at once, so the proxy model filters once
+        self.attr_list.model().sourceModel().invisibleRootItem().appendRows([QStandardItem(attr) for attr in common_attributes])
 
-    def _list_attributes(self, node, **kwargs) -> list[str]:
+    def _list_attributes(self, node) -> list[str]:
         """List the attributes of the node.
 
+        Notes:
+            - Compound, array and message attributes are excluded.
+            - The attribute types are read with the API instead of one attributeQuery and getAttr per attribute.
+
         Args:
             node (str): The node name.
 
         Returns:
             list[str]: The attributes of the node.
         """
-        except_attr_types = kwargs.pop("except_attr_types", ["message", "TdataCompound"])
+        selection_list = om.MSelectionList()
+        selection_list.add(node)
+        node_obj = selection_list.getDependNode(0)
+        fn = om.MFnDependencyNode(node_obj)
 
         result_attrs = []
 
-        if "transform" in cmds.nodeType(node, inherited=True):
-            result_attrs.extend(
-                ["translateX", "translateY", "translateZ", "rotateX", "rotateY", "rotateZ", "scaleX", "scaleY", "scaleZ", "visibility"]
-            )
+        if node_obj.hasFn(om.MFn.kTransform):
+            result_attrs.extend(_TRANSFORM_ATTRS)
 
         user_attrs = cmds.listAttr(node, userDefined=True)
         if user_attrs:
             result_attrs.extend(user_attrs)
 
+        seen_attrs = set(result_attrs)
         write_attrs = cmds.listAttr(node, write=True) or []
         for attr in write_attrs:
-            if attr in result_attrs:
+            if attr in seen_attrs:
                 continue
-            try:
-                if cmds.attributeQuery(attr, node=node, listChildren=True):
-                    continue
-                if cmds.getAttr(f"{node}.{attr}", type=True) in except_attr_types:
-                    continue
-                result_attrs.append(attr)
-            except RuntimeError:
+
+            # Child attributes of arrays are listed with dotted names and cannot be resolved from the node
+            if not fn.hasAttribute(attr):
                 logger.debug(f"Failed to list attribute: {node}.{attr}")
+                continue
+
+            attr_obj = fn.attribute(attr)
+            if attr_obj.hasFn(om.MFn.kCompoundAttribute) or attr_obj.hasFn(om.MFn.kMessageAttribute):
+                continue
+            if om.MFnAttribute(attr_obj).array:
+                continue
+
+            result_attrs.append(attr)
+            seen_attrs.add(attr)
 
         return result_attrs
 
@@ -4,6 +4,7 @@ Attribute set tool.
 
 from logging import getLogger
 
+import maya.api.OpenMaya as om
 import maya.cmds as cmds
 
 try:
@@ -17,6 +18,25 @@ from ..lib_ui.widgets import nodeAttr_widgets
 logger = getLogger(__name__)
 
 
+def _get_attribute_type(attr_obj: om.MObject) -> tuple:
+    """Get a key that identifies the data type of the attribute.
+
+    Args:
+        attr_obj (om.MObject): The attribute object.
+
+    Returns:
+        tuple: The attribute kind and its data type.
+    """
+    if attr_obj.hasFn(om.MFn.kNumericAttribute):
+        return ("numeric", om.MFnNumericAttribute(attr_obj).numericType())
+    if attr_obj.hasFn(om.MFn.kUnitAttribute):
+        return ("unit", om.MFnUnitAttribute(attr_obj).unitType())
+    if attr_obj.hasFn(om.MFn.kTypedAttribute):
+        return ("typed", om.MFnTypedAttribute(attr_obj).attrType())
+
+    return ("other", attr_obj.apiType())
+
+
 class MainWindow(base_window.BaseMainWindow):
     """Attribute Lister Main Window."""
 
@@ -52,23 +72,29 @@ class MainWindow(base_window.BaseMainWindow):
 
         attr_types = set()
         for node in nodes:
+            selection_list = om.MSelectionList()
+            selection_list.add(node)
+            fn = om.MFnDependencyNode(selection_list.getDependNode(0))
+
             for attr in attrs:
-                if cmds.getAttr(f"{node}.{attr}", lock=True):
+                plug = fn.findPlug(attr, False)
+                if plug.isLocked:
                     self.value_field.setEnabled(False)
                     self.value_field.setStyleSheet("background-color: darkgrey;")
 
                     logger.debug(f"Attribute is locked: {node}.{attr}")
                     return
 
-                if cmds.connectionInfo(f"{node}.{attr}", isDestination=True):
+                if plug.isDestination:
                     self.value_field.setEnabled(False)
                     self.value_field.setStyleSheet("background-color: lightyellow;")
 
                     logger.debug(f"Attribute is connected: {node}.{attr}")
                     return
 
-                attr_type = cmds.getAttr(f"{node}.{attr}", type=True)
-                attr_types.add(attr_type)
+                # Once the types differ, only the lock and connection states are still checked
+                if len(attr_types) < 2:
+                    attr_types.add(_get_attribute_type(plug.attribute()))
 
         if len(attr_types) > 1:
             self.value_field.setEnabled(False)
@@ -109,14 +135,17 @@ class MainWindow(base_window.BaseMainWindow):
             else:
                 raise ValueError(f"Unsupported attribute type: {attr_type}")
 
+            # Build the setAttr arguments once for all plugs
+            if attr_type == "matrix":
+                set_args, set_kwargs = tuple(value), {"type": attr_type}
+            elif attr_type == "string":
+                set_args, set_kwargs = (value,), {"type": attr_type}
+            else:
+                set_args, set_kwargs = (value,), {}
+
             for node in nodes:
                 for attr in attrs:
-                    if attr_type == "matrix":
-                        cmds.setAttr(f"{node}.{attr}", *value, type=attr_type)
-                    elif attr_type == "string":
-                        cmds.setAttr(f"{node}.{attr}", value, type=attr_type)
-                    else:
-                        cmds.setAttr(f"{node}.{attr}", value)
+                    cmds.setAttr(f"{node}.{attr}", *set_args, **set_kwargs)
 
         except (ValueError, SyntaxError, TypeError) as e:
             cmds.error(f"Invalid input value: {value}. \n{str(e)}")
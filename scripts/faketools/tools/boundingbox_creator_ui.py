@@ -115,16 +115,19 @@ class AxisAlignedBoxWidget(BaseBoxWidget):
         label = QLabel("Axis Direction:", alignment=Qt.AlignRight | Qt.AlignVCenter)
         layout.addWidget(label, 0, 0)
 
+        # The three components share one validator
+        axis_direction_validator = QDoubleValidator(0, 1, 2, self)
+
         self.x_axis_direction = QLineEdit()
-        self.x_axis_direction.setValidator(QDoubleValidator(0, 1, 2))
+        self.x_axis_direction.setValidator(axis_direction_validator)
         layout.addWidget(self.x_axis_direction, 0, 1)
 
         self.y_axis_direction = QLineEdit()
-        self.y_axis_direction.setValidator(QDoubleValidator(0, 1, 2))
+        self.y_axis_direction.setValidator(axis_direction_validator)
         layout.addWidget(self.y_axis_direction, 0, 2)
 
         self.z_axis_direction = QLineEdit()
-        self.z_axis_direction.setValidator(QDoubleValidator(0, 1, 2))
+        self.z_axis_direction.setValidator(axis_direction_validator)
         layout.addWidget(self.z_axis_direction, 0, 3)
 
         label = QLabel("Axis:", alignment=Qt.AlignRight | Qt.AlignVCenter)
@@ -255,7 +258,8 @@ class MainWindow(base_window.BaseMainWindow):
         color = color.lighter(115)
         self.stock_widget.setStyleSheet(f"QStackedWidget {{ background-color: {color.name()}; }}")
 
-        for bounding_type in self._boundingbox_widgets:
+        # Add the option widgets in the combo box order, so that the combo box index is the stacked widget index
+        for bounding_type in self._boundingbox_types.values():
             widget = self._boundingbox_widgets[bounding_type]()
             self.stock_widget.addWidget(widget)
 
@@ -342,16 +346,19 @@ class BaseLineWidget(QWidget):
         label = QLabel("Base Line:", alignment=Qt.AlignRight | Qt.AlignVCenter)
         layout.addWidget(label)
 
+        # The three components share one validator
+        base_line_validator = QDoubleValidator(-1, 1, 2, self)
+
         self.x_base_line = QLineEdit()
-        self.x_base_line.setValidator(QDoubleValidator(-1, 1, 2))
+        self.x_base_line.setValidator(base_line_validator)
         layout.addWidget(self.x_base_line)
 
         self.y_base_line = QLineEdit()
-        self.y_base_line.setValidator(QDoubleValidator(-1, 1, 2))
+        self.y_base_line.setValidator(base_line_validator)
         layout.addWidget(self.y_base_line)
 
         self.z_base_line = QLineEdit()
-        self.z_base_line.setValidator(QDoubleValidator(-1, 1, 2))
+        self.z_base_line.setValidator(base_line_validator)
         layout.addWidget(self.z_base_line)
 
         self.setLayout(layout)
@@ -389,10 +396,11 @@ class BaseLineWidget(QWidget):
 
     def _on_text_changed(self, text):
         """Slot for the text changed signal."""
+        # Empty or partial input such as "-" or "." is still being typed and cannot be out of range
         try:
             value = float(text)
         except ValueError:
-            value = 0.0
+            return
 
         if not (-1.0 <= value <= 1.0):
             cmds.warning("Base line must be in the range of -1.0 to 1.0.")
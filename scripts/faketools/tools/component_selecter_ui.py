@@ -48,9 +48,13 @@ class MainWindow(base_window.BaseMainWindow):
         self.menu = self.menuBar()
         self._add_menu()
 
+        # Header labels share one bold font instead of parsing a style sheet each
+        bold_font = self.font()
+        bold_font.setBold(True)
+
         # Unique selection
         label = QLabel("Unique Selection")
-        label.setStyleSheet("font-weight: bold;")
+        label.setFont(bold_font)
         self.central_layout.addWidget(label)
 
         unique_sel_button = QPushButton("Unique")
@@ -67,7 +71,7 @@ class MainWindow(base_window.BaseMainWindow):
 
         # Area selection
         label = QLabel("Area Selection")
-        label.setStyleSheet("font-weight: bold;")
+        label.setFont(bold_font)
         self.central_layout.addWidget(label)
 
         layout = QHBoxLayout()
@@ -88,7 +92,7 @@ class MainWindow(base_window.BaseMainWindow):
 
         # Control components selection
         label = QLabel("CV Area Selection")
-        label.setStyleSheet("font-weight: bold;")
+        label.setFont(bold_font)
         self.central_layout.addWidget(label)
 
         layout = QGridLayout()
@@ -141,9 +145,9 @@ class MainWindow(base_window.BaseMainWindow):
         unique_sel_button.clicked.connect(self.unique_selection)
         reverse_sel_button.clicked.connect(self.reverse_selection)
         same_sel_button.clicked.connect(self.same_selection)
-        right_area_sel_button.clicked.connect(self.right_area_selection)
-        center_area_sel_button.clicked.connect(self.center_area_selection)
-        left_area_sel_button.clicked.connect(self.left_area_selection)
+        right_area_sel_button.clicked.connect(lambda: self.x_area_selection("right"))
+        center_area_sel_button.clicked.connect(lambda: self.x_area_selection("center"))
+        left_area_sel_button.clicked.connect(lambda: self.x_area_selection("left"))
         uv_sel_button.clicked.connect(self.uv_area_selection)
 
         self.min_param_spinbox.valueChanged.connect(self.__update_uv_spinbox)
@@ -163,7 +167,8 @@ class MainWindow(base_window.BaseMainWindow):
     @maya_ui.error_handler
     def unique_selection(self):
         """Unique selection."""
-        sel_components = cmds.ls(selection=True, flatten=True)
+        # Component ranges are expanded by ComponentSelection, so the selection is not flattened here
+        sel_components = cmds.ls(selection=True)
         if not sel_components:
             cmds.error("Select components.")
 
@@ -174,7 +179,7 @@ class MainWindow(base_window.BaseMainWindow):
     @maya_ui.error_handler
     def reverse_selection(self):
         """Reverse selection."""
-        sel_components = cmds.ls(selection=True, flatten=True)
+        sel_components = cmds.ls(selection=True)
         if not sel_components:
             cmds.error("Select components.")
 
@@ -185,7 +190,7 @@ class MainWindow(base_window.BaseMainWindow):
     @maya_ui.error_handler
     def same_selection(self):
         """Same selection."""
-        sel_nodes = cmds.ls(selection=True, flatten=True)
+        sel_nodes = cmds.ls(selection=True)
         if not sel_nodes:
             cmds.error("Select objects.")
 
@@ -213,47 +218,23 @@ class MainWindow(base_window.BaseMainWindow):
         else:
             cmds.select(same_components, r=True)
 
-    @maya_ui.undo_chunk("Right area selection")
-    @maya_ui.error_handler
-    def right_area_selection(self):
-        """Right area selection."""
-        sel_components = self._select_objects_to_components()
-        if not sel_components:
-            cmds.error("Select transform or shape nodes.")
-
-        right_components = lib_component.ComponentSelection(sel_components).x_area_selection(area="right")
-        if not right_components:
-            cmds.warning("No right components.")
-        else:
-            cmds.select(right_components, r=True)
-
-    @maya_ui.undo_chunk("Left area selection")
+    @maya_ui.undo_chunk("Area selection")
     @maya_ui.error_handler
-    def left_area_selection(self):
-        """Left selection."""
-        sel_components = self._select_objects_to_components()
-        if not sel_components:
-            cmds.error("Select transform or shape nodes.")
+    def x_area_selection(self, area: str):
+        """X area selection.
 
-        left_components = lib_component.ComponentSelection(sel_components).x_area_selection(area="left")
-        if not left_components:
-            cmds.warning("No left components.")
-        else:
-            cmds.select(left_components, r=True)
-
-    @maya_ui.undo_chunk("Center area selection")
-    @maya_ui.error_handler
-    def center_area_selection(self):
-        """Center selection."""
+        Args:
+            area (str): The area to select. 'right', 'left' or 'center'.
+        """
         sel_components = self._select_objects_to_components()
         if not sel_components:
             cmds.error("Select transform or shape nodes.")
 
-        center_components = lib_component.ComponentSelection(sel_components).x_area_selection(area="center")
-        if not center_components:
-            cmds.warning("No center components.")
+        area_components = lib_component.ComponentSelection(sel_components).x_area_selection(area=area)
+        if not area_components:
+            cmds.warning(f"No {area} components.")
         else:
-            cmds.select(center_components, r=True)
+            cmds.select(area_components, r=True)
 
     @maya_ui.undo_chunk("UV area selection")
     @maya_ui.error_handler
@@ -278,21 +259,15 @@ class MainWindow(base_window.BaseMainWindow):
     @maya_ui.error_handler
     def toggle_soft_selection(self):
         """Toggle soft selection."""
-        current_soft_select = cmds.softSelect(q=True, sse=True)
-        if current_soft_select:
-            cmds.softSelect(sse=False)
-        else:
-            cmds.softSelect(sse=True)
+        cmds.softSelect(sse=not cmds.softSelect(q=True, sse=True))
 
     @maya_ui.undo_chunk("Toggle symmetry selection")
     @maya_ui.error_handler
     def toggle_symmetry_selection(self):
         """Toggle symmetry selection."""
-        current_symmetric = cmds.symmetricModelling(q=True, s=True)
-        if current_symmetric:
-            cmds.symmetricModelling(s=False)
-        else:
-            cmds.symmetricModelling(s=True)
+        symmetric = not cmds.symmetricModelling(q=True, s=True)
+        cmds.symmetricModelling(s=symmetric)
+        if symmetric:
             cmds.select(cmds.ls(sl=True), sym=True)
 
     def _select_objects_to_components(self, filter_types: list[str] = None) -> list[str]:
@@ -311,27 +286,44 @@ class MainWindow(base_window.BaseMainWindow):
             cmds.error("Select transform or shape nodes.")
 
         objects = list(dict.fromkeys(objects))
-        components = []
+
+        # Classify the objects with one query, the result is a flat list of name and type pairs
+        typed_objects = cmds.ls(objects, showType=True, long=True)
+        object_types = dict(zip(typed_objects[::2], typed_objects[1::2], strict=False))
+
+        transforms = [obj for obj in objects if object_types.get(obj) == "transform"]
+
+        # Resolve the first non-intermediate shape of every transform with one query
+        transform_shapes = {}
+        if transforms:
+            typed_shapes = cmds.ls(cmds.listRelatives(transforms, shapes=True, fullPath=True, ni=True) or [], showType=True, long=True)
+            for shape, shape_type in zip(typed_shapes[::2], typed_shapes[1::2], strict=False):
+                transform_shapes.setdefault(shape.rsplit("|", 1)[0], (shape, shape_type))
+
+        component_objects = []
         for obj in objects:
-            if cmds.nodeType(obj) == "transform":
-                shape = cmds.listRelatives(obj, shapes=True, fullPath=True, ni=True)
-                if not shape:
+            obj_type = object_types.get(obj)
+            if obj_type == "transform":
+                if obj not in transform_shapes:
                     continue
-                shape = shape[0]
-            elif "geometryShape" in cmds.nodeType(obj, i=True):
-                shape = obj
-                obj = cmds.listRelatives(obj, parent=True, fullPath=True)[0]
+                shape, shape_type = transform_shapes[obj]
+            elif obj_type in filter_types:
+                shape, shape_type = obj, obj_type
+                obj = obj.rsplit("|", 1)[0]
             else:
                 logger.debug(f"Invalid object: {obj}")
                 continue
 
-            if cmds.nodeType(shape) not in filter_types:
+            if shape_type not in filter_types:
                 logger.debug(f"Invalid shape type not in {filter_types}: {shape}")
                 continue
 
-            components.extend(cmds.ls(f"{obj}.cp[*]", flatten=True))
+            component_objects.append(obj)
+
+        if not component_objects:
+            return []
 
-        return components
+        return cmds.ls([f"{obj}.cp[*]" for obj in component_objects], flatten=True)
 
     def __update_uv_spinbox(self):
         """Update UV spinbox."""
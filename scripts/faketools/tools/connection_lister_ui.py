@@ -7,10 +7,11 @@ from __future__ import annotations
 from functools import partial
 from logging import getLogger
 
+import maya.api.OpenMaya as om
 import maya.cmds as cmds
 
 try:
-    from PySide2.QtCore import QItemSelectionModel, Qt, Signal
+    from PySide2.QtCore import QItemSelectionModel, Qt, QTimer, Signal
     from PySide2.QtGui import QStandardItem
     from PySide2.QtWidgets import (
         QApplication,
@@ -27,7 +28,7 @@ try:
         QWidget,
     )
 except ImportError:
-    from PySide6.QtCore import QItemSelectionModel, Qt, Signal
+    from PySide6.QtCore import QItemSelectionModel, Qt, QTimer, Signal
     from PySide6.QtGui import QStandardItem
     from PySide6.QtWidgets import (
         QApplication,
@@ -51,6 +52,45 @@ from ..lib_ui.widgets import nodeAttr_widgets
 
 logger = getLogger(__name__)
 
+# Delay in milliseconds before the attribute filter is applied after typing.
+_FILTER_DELAY_MSEC = 150
+
+# Attributes listed first for transform nodes.
+_TRANSFORM_ATTRS = (
+    "translate",
+    "rotate",
+    "scale",
+    "shear",
+    "translateX",
+    "translateY",
+    "translateZ",
+    "rotateX",
+    "rotateY",
+    "rotateZ",
+    "scaleX",
+    "scaleY",
+    "scaleZ",
+    "shearXY",
+    "shearXZ",
+    "shearYZ",
+    "visibility",
+)
+
+# Compound attribute types that are listed as numeric values (double3, float2, ...).
+_NUMERIC_COMPOUND_TYPES = frozenset(
+    (
+        om.MFn.kAttribute2Double,
+        om.MFn.kAttribute2Float,
+        om.MFn.kAttribute2Int,
+        om.MFn.kAttribute2Short,
+        om.MFn.kAttribute3Double,
+        om.MFn.kAttribute3Float,
+        om.MFn.kAttribute3Int,
+        om.MFn.kAttribute3Short,
+        om.MFn.kAttribute4Double,
+    )
+)
+
 
 class MainWindow(base_window.BaseMainWindow):
     """Attribute Connection Lister Main Window."""
@@ -61,6 +101,9 @@ class MainWindow(base_window.BaseMainWindow):
 
         self.tool_options = optionvar.ToolOptionSettings(__name__)
 
+        # Attributes per node type, cleared when the nodes are loaded
+        self._type_attr_cache = {}
+
         # Load button
         load_button_layout = QHBoxLayout()
         load_button_layout.setContentsMargins(0, 0, 0, 0)
@@ -129,6 +172,14 @@ class MainWindow(base_window.BaseMainWindow):
         self.dest_filter_line_edit.setPlaceholderText("Filter attributes...")
         layout.addWidget(self.dest_filter_line_edit, 1, 1)
 
+        self.source_filter_timer = QTimer(self)
+        self.source_filter_timer.setSingleShot(True)
+        self.source_filter_timer.setInterval(_FILTER_DELAY_MSEC)
+
+        self.dest_filter_timer = QTimer(self)
+        self.dest_filter_timer.setSingleShot(True)
+        self.dest_filter_timer.setInterval(_FILTER_DELAY_MSEC)
+
         copy_value_button = QPushButton("Copy Value")
         layout.addWidget(copy_value_button, 2, 0)
 
@@ -171,8 +222,10 @@ class MainWindow(base_window.BaseMainWindow):
         )  # noqa
         self.dest_node_list.selectionModel().selectionChanged.connect(lambda: self._set_node_count(self.dest_node_list, self.dest_node_count_label))
         operation_switch_widget.button_changed.connect(self.__switch_operation)
-        self.source_filter_line_edit.textChanged.connect(self.source_attr_list.attr_model.setFilterFixedString)
-        self.dest_filter_line_edit.textChanged.connect(self.dest_attr_list.attr_model.setFilterFixedString)
+        self.source_filter_line_edit.textChanged.connect(lambda: self.source_filter_timer.start())
+        self.dest_filter_line_edit.textChanged.connect(lambda: self.dest_filter_timer.start())
+        self.source_filter_timer.timeout.connect(lambda: self._apply_filter(self.source_filter_line_edit, self.source_attr_list))
+        self.dest_filter_timer.timeout.connect(lambda: self._apply_filter(self.dest_filter_line_edit, self.dest_attr_list))
         copy_value_button.clicked.connect(self._copy_value)
         connect_button.clicked.connect(self._connect_attribute)
 
@@ -184,6 +237,15 @@ class MainWindow(base_window.BaseMainWindow):
         """
         self.operation_stack_widget.setCurrentIndex(index)
 
+    def _apply_filter(self, filter_line_edit: QLineEdit, attr_list_widget: nodeAttr_widgets.AttributeListView) -> None:
+        """Filter the attribute list with the text of the filter field.
+
+        Args:
+            filter_line_edit (QLineEdit): The filter field.
+            attr_list_widget (AttributeList): The attribute list widget.
+        """
+        attr_list_widget.attr_model.setFilterFixedString(filter_line_edit.text())
+
     @maya_ui.error_handler
     def _list_nodes(self, node_list_widget: nodeAttr_widgets.NodeListView, display_attributes_callback: callable) -> None:
         """Update the node list
@@ -196,6 +258,9 @@ class MainWindow(base_window.BaseMainWindow):
         if not sel_nodes:
             cmds.error("Please select the nodes to list.")
 
+        # The node types may have changed since the last load
+        self._type_attr_cache.clear()
+
         shift_pressed = QApplication.keyboardModifiers() == Qt.ShiftModifier
         if shift_pressed:
             nodes = node_list_widget.get_all_nodes()
@@ -263,13 +328,14 @@ class MainWindow(base_window.BaseMainWindow):
         common_attributes = list_attributes_callback(selected_nodes[0])
 
         if len(selected_nodes) > 1:
+            # Intersect as sets and keep the order of the first node
+            common_set = set(common_attributes)
             for node in selected_nodes[1:]:
-                node_attrs = list_attributes_callback(node)
-                common_attributes = [attr for attr in common_attributes if attr in node_attrs]
+                common_set.intersection_update(list_attributes_callback(node))
+            common_attributes = [attr for attr in common_attributes if attr in common_set]
 
-        for attr in common_attributes:
-            item = QStandardItem(attr)
-            attr_list_widget.model().sourceModel().appendRow(item)
+        # Append all rows at once, so the proxy model filters once
+        attr_list_widget.model().sourceModel().invisibleRootItem().appendRows([QStandardItem(attr) for attr in common_attributes])
 
     def _source_list_attributes(self, node: str) -> list[str]:
         """List the attributes of the node.
@@ -296,54 +362,77 @@ class MainWindow(base_window.BaseMainWindow):
     def _list_attributes(self, node: str) -> list[str]:
         """List the attributes of the node.
 
+        Notes:
+            - The attributes of the node type are cached, and only the user defined attributes are listed per node.
+
         Args:
             node (str): The node name.
 
         Returns:
             list[str]: The attributes of the node.
         """
-        result_attrs = []
-
-        if "transform" in cmds.nodeType(node, inherited=True):
-            result_attrs.extend(
-                [
-                    "translate",
-                    "rotate",
-                    "scale",
-                    "shear",
-                    "translateX",
-                    "translateY",
-                    "translateZ",
-                    "rotateX",
-                    "rotateY",
-                    "rotateZ",
-                    "scaleX",
-                    "scaleY",
-                    "scaleZ",
-                    "shearXY",
-                    "shearXZ",
-                    "shearYZ",
-                    "visibility",
-                ]
-            )
+        node_type = cmds.nodeType(node)
+        if node_type not in self._type_attr_cache:
+            self._type_attr_cache[node_type] = self._list_type_attributes(node)
+        lead_attrs, type_attrs = self._type_attr_cache[node_type]
+
+        result_attrs = list(lead_attrs)
 
         user_attrs = cmds.listAttr(node, userDefined=True)
         if user_attrs:
             result_attrs.extend(user_attrs)
 
+        seen_attrs = set(result_attrs)
+        result_attrs.extend(attr for attr in type_attrs if attr not in seen_attrs)
+
+        return result_attrs
+
+    def _list_type_attributes(self, node: str) -> tuple[list[str], list[str]]:
+        """List the attributes shared by all nodes of the node type.
+
+        Notes:
+            - Array attributes and compound attributes other than numeric compounds (double3, float2, ...) are excluded.
+            - The attribute types are read with the API instead of one getAttr per attribute.
+
+        Args:
+            node (str): The node name.
+
+        Returns:
+            tuple[list[str], list[str]]: The attributes listed before the user defined attributes and the other attributes.
+        """
+        selection_list = om.MSelectionList()
+        selection_list.add(node)
+        node_obj = selection_list.getDependNode(0)
+        fn = om.MFnDependencyNode(node_obj)
+
+        lead_attrs = []
+        if node_obj.hasFn(om.MFn.kTransform):
+            lead_attrs.extend(_TRANSFORM_ATTRS)
+
+        user_attrs = set(cmds.listAttr(node, userDefined=True) or [])
+        seen_attrs = set(lead_attrs)
+
+        type_attrs = []
         attrs = cmds.listAttr(node) or []
-        except_attr_types = ["TdataCompound"]
         for attr in attrs:
-            if attr in result_attrs:
+            if attr in seen_attrs or attr in user_attrs:
                 continue
-            try:
-                if cmds.getAttr(f"{node}.{attr}", type=True) in except_attr_types:
-                    continue
-                result_attrs.append(attr)
-            except Exception:
+
+            # Child attributes of arrays are listed with dotted names and cannot be resolved from the node
+            if not fn.hasAttribute(attr):
                 logger.debug(f"Failed to list attribute: {node}.{attr}")
+                continue
 
-        return result_attrs
+            attr_obj = fn.attribute(attr)
+            if attr_obj.hasFn(om.MFn.kCompoundAttribute) and attr_obj.apiType() not in _NUMERIC_COMPOUND_TYPES:
+                continue
+            if om.MFnAttribute(attr_obj).array:
+                continue
+
+            type_attrs.append(attr)
+            seen_attrs.add(attr)
+
+        return lead_attrs, type_attrs
 
     @maya_ui.undo_chunk("Copy Attribute Value")
     @maya_ui.error_handler
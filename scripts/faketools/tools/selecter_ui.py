@@ -557,6 +557,7 @@ class SubstitutionSelectionWidget(QWidget):
         nodes = [node.split("|")[-1] for node in nodes]
         convert_names = lib_name.substitute_names(nodes, search_text, replace_text)
 
+        source_nodes = []
         result_nodes = []
         for name, node in zip(convert_names, nodes, strict=False):
             if not cmds.objExists(name):
@@ -567,10 +568,12 @@ class SubstitutionSelectionWidget(QWidget):
                 cmds.warning(f"Failed to name substitute: {node}")
                 continue
 
-            rigging_setup.mirror_dag_node(node, name, mirror_position=mirror_pos, mirror_rotation=mirror_rot)
-
+            source_nodes.append(node)
             result_nodes.append(name)
 
+        if result_nodes:
+            rigging_setup.mirror_dag_nodes(source_nodes, result_nodes, mirror_position=mirror_pos, mirror_rotation=mirror_rot)
+
         # Save tool options
         self.save_tool_options()
 